@@ -7,11 +7,90 @@ using TikTok's Content Posting API.
 import os
 import json
 import csv
+import hashlib
+import math
+import mmap
+import random
+import re
 import requests
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    orjson = None
+
+
+# Number of videos processed concurrently in bulk mode
+MAX_WORKERS = 4
+
+# Maximum number of videos started per minute (replaces the old fixed delay)
+UPLOADS_PER_MINUTE = 12
+
+# Number of chunks of a single video uploaded concurrently
+CHUNK_WORKERS = 4
+
+# Number of publish calls issued concurrently; publishing is a small API
+# request, so it runs in its own pool and never waits behind uploads
+PUBLISH_WORKERS = 8
+
+# Retries for a chunk that fails with a 5xx or connection error
+CHUNK_MAX_RETRIES = 3
+
+# (connect, read) timeout in seconds for a chunk PUT, so a stalled
+# connection is retried instead of holding an in-flight slot forever
+CHUNK_TIMEOUT = (10, 120)
+
+# Retries for an API call rejected with HTTP 429 (Too Many Requests), or
+# with a gateway error on calls that are safe to repeat
+API_MAX_RETRIES = 3
+
+# Gateway errors retried for calls made with retry_server_errors=True
+RETRY_STATUS_CODES = (502, 503, 504)
+
+# Longest a worker will wait on a single Retry-After before retrying
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+# Timeout (seconds) of the best-effort connection warm-up at startup
+WARMUP_TIMEOUT = 3
+
+# Bytes of an error response body parsed for the error message
+ERROR_BODY_LIMIT = 4096
+
+# Chunks are powers of two (which also keeps chunk offsets page-aligned).
+# CHUNK_SHIFT is used until upload bandwidth has been measured; adaptive
+# sizing stays within the 5MB..64MB range accepted by the Content Posting API.
+CHUNK_SHIFT = 23
+CHUNK_SIZE = 1 << CHUNK_SHIFT  # 8MiB
+MIN_CHUNK_SHIFT = 23  # 8MiB
+MAX_CHUNK_SHIFT = 25  # 32MiB (64MiB would exceed 64MB)
+
+# Adaptive chunk sizing aims for each chunk PUT to take about this long
+TARGET_CHUNK_SECONDS = 2.0
+
+# Weight of the newest throughput sample in the bandwidth EWMA
+BANDWIDTH_EWMA_ALPHA = 0.3
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
 
 
 class CustomException(Exception):
@@ -19,10 +98,120 @@ class CustomException(Exception):
     pass
 
 
+def _advise(mm: mmap.mmap, advice: Optional[int], start: int, length: int):
+    """
+    Best-effort madvise() over a byte range of a mapped file
+    
+    Silently does nothing on platforms without madvise (e.g. Windows).
+    
+    Args:
+        mm: Mapped video file
+        advice: mmap.MADV_* constant, or None if unsupported
+        start: Offset of the range in bytes
+        length: Length of the range in bytes
+    """
+    if advice is None:
+        return
+    
+    # madvise requires a page-aligned start and a range inside the mapping
+    aligned = start - start % mmap.PAGESIZE
+    end = min(start + length, len(mm))
+    if end <= aligned:
+        return
+    
+    try:
+        mm.madvise(advice, aligned, end - aligned)
+    except OSError:
+        pass
+
+
+def _positive_setting(config: Dict, key: str, default, integer: bool = True):
+    """
+    Read a positive numeric setting from the configuration
+    
+    Args:
+        config: Parsed configuration
+        key: Setting name
+        default: Value used when the setting is absent
+        integer: Whether the value must be a whole number
+        
+    Returns:
+        The setting's value
+        
+    Raises:
+        CustomException: If the value is not a positive (finite) number
+    """
+    value = config.get(key, default)
+    allowed = int if integer else (int, float)
+    if isinstance(value, bool) or not isinstance(value, allowed) \
+            or not math.isfinite(value) or value <= 0:
+        kind = "integer" if integer else "number"
+        raise CustomException(f"Invalid configuration: {key} must be a positive {kind}, got {value!r}")
+    return value
+
+
+def _stat_video(video_path: str) -> int:
+    """
+    Stat a video file once and return its size
+    
+    Args:
+        video_path: Path to video file
+        
+    Returns:
+        File size in bytes
+        
+    Raises:
+        CustomException: If the file is missing or empty
+    """
+    try:
+        file_size = os.stat(video_path).st_size
+    except OSError:
+        raise CustomException(f"Video file not found: {video_path}")
+    
+    if file_size == 0:
+        raise CustomException(f"Video file is empty: {video_path}")
+    return file_size
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace API calls across workers"""
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize token bucket
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class TikTokScheduler:
     """Main class for handling TikTok video uploads and scheduling"""
     
-    def __init__(self, client_key: str, client_secret: str, access_token: str):
+    def __init__(self, client_key: str, client_secret: str, access_token: str,
+                 max_workers: int = MAX_WORKERS, chunk_workers: int = CHUNK_WORKERS,
+                 publish_workers: int = PUBLISH_WORKERS):
         """
         Initialize TikTok Scheduler
         
@@ -30,24 +219,88 @@ class TikTokScheduler:
             client_key: TikTok API client key
             client_secret: TikTok API client secret
             access_token: OAuth access token with video.upload scope
+            max_workers: Number of videos processed concurrently
+            chunk_workers: Number of chunks of a single video uploaded concurrently
+            publish_workers: Number of publish calls issued concurrently
         """
         self.client_key = client_key
         self.client_secret = client_secret
         self.access_token = access_token
         self.base_url = "https://open.tiktokapis.com/v2"
+        self.max_workers = max_workers
+        self.chunk_workers = chunk_workers
+        self.publish_workers = publish_workers
+        
+        # Per-connection upload bandwidth (bytes/s), smoothed across chunks
+        # and videos; used to size the chunks of the next upload
+        self._ewma_bw = None
+        self._target_rtt = TARGET_CHUNK_SECONDS
+        self._bw_lock = threading.Lock()
+        
+        # Fixed fields of every publish request; publish_video copies this
+        # and only fills in the per-video values
+        self._publish_post_info = {
+            "disable_duet": False,
+            "disable_comment": False,
+            "disable_stitch": False,
+            "video_cover_timestamp_ms": 1000
+        }
+        
+        # A single session is shared by all worker threads; size its
+        # connection pool so concurrent uploads don't discard connections.
+        # Pools block when exhausted instead of opening throwaway connections.
         self.session = requests.Session()
+        api_adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max_workers + publish_workers,
+            pool_block=True,
+            # Only failed connection attempts are retried here: nothing was
+            # sent, so this is safe even for POST. Status-based retries are
+            # handled per call in _make_request.
+            max_retries=Retry(total=3, read=0, backoff_factor=0.5, raise_on_status=False)
+        )
+        self.session.mount("https://", api_adapter)
         self.session.headers.update({
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json"
         })
+        
+        # Chunk PUTs in flight across all videos are capped process-wide, so
+        # memory and connections stay bounded however many videos run at once
+        self.max_chunks_in_flight = 2 * chunk_workers
+        self._chunk_slots = threading.BoundedSemaphore(self.max_chunks_in_flight)
+        
+        # Separate session for chunk PUTs so the TLS connection to the upload
+        # host is kept alive across chunks (no API auth/JSON headers here).
+        # Every in-flight chunk may hold a connection.
+        self.upload_session = requests.Session()
+        self.upload_session.mount("https://", HTTPAdapter(pool_connections=8,
+                                                          pool_maxsize=self.max_chunks_in_flight,
+                                                          pool_block=True))
+        
+        # Open the TLS connection to the API host now so the first video
+        # doesn't pay for the handshake; any response (even an error) will do.
+        # This is best-effort, so it gets a single short attempt: retries are
+        # switched off on the adapter (no other thread uses it yet).
+        retries = api_adapter.max_retries
+        api_adapter.max_retries = Retry(total=0, raise_on_status=False)
+        try:
+            self.session.head(self.base_url, timeout=WARMUP_TIMEOUT)
+        except requests.exceptions.RequestException:
+            pass
+        finally:
+            api_adapter.max_retries = retries
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
+    def _make_request(self, method: str, endpoint: str,
+                      retry_server_errors: bool = False, **kwargs) -> Dict:
         """
         Make API request with error handling
         
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
+            retry_server_errors: Also retry 502/503/504 responses; only for
+                calls that are safe to repeat
             **kwargs: Additional request parameters
             
         Returns:
@@ -59,35 +312,91 @@ class TikTokScheduler:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response = self.session.request(method, url, **kwargs)
+            for attempt in range(API_MAX_RETRIES + 1):
+                response = self.session.request(method, url, **kwargs)
+                retryable = response.status_code == 429 or (
+                    retry_server_errors and response.status_code in RETRY_STATUS_CODES)
+                if not retryable or attempt == API_MAX_RETRIES:
+                    break
+                
+                # Rate limited or gateway error: respect Retry-After, else back
+                # off exponentially
+                try:
+                    delay = float(response.headers.get("Retry-After", ""))
+                except ValueError:
+                    delay = math.nan
+                if not math.isfinite(delay) or delay < 0:
+                    delay = 2 ** attempt + random.uniform(0, 1)
+                delay = min(delay, MAX_RETRY_AFTER_SECONDS)
+                print(f"HTTP {response.status_code}, retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
+            
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
             error_msg = f"HTTP Error: {e.response.status_code}"
+            # Only look at the start of the body: API errors are small JSON
+            # documents, while gateway errors can be large HTML pages
+            body = e.response.content[:ERROR_BODY_LIMIT]
             try:
-                error_data = e.response.json()
+                error_data = _json_loads(body)
                 error_msg += f" - {error_data.get('error', {}).get('message', 'Unknown error')}"
-            except:
-                error_msg += f" - {e.response.text}"
+            except Exception:
+                error_msg += f" - {body.decode('utf-8', 'replace')}"
             raise CustomException(error_msg)
         except requests.exceptions.RequestException as e:
             raise CustomException(f"Request failed: {str(e)}")
     
-    def initialize_upload(self, video_path: str) -> Dict:
+    def _record_throughput(self, nbytes: int, elapsed: float):
+        """
+        Fold one chunk's throughput into the bandwidth EWMA
+        
+        Args:
+            nbytes: Size of the uploaded chunk in bytes
+            elapsed: Time the PUT took in seconds
+        """
+        if elapsed <= 0:
+            return
+        
+        bw = nbytes / elapsed
+        with self._bw_lock:
+            if self._ewma_bw is None:
+                self._ewma_bw = bw
+            else:
+                self._ewma_bw = BANDWIDTH_EWMA_ALPHA * bw + (1 - BANDWIDTH_EWMA_ALPHA) * self._ewma_bw
+    
+    def _next_chunk_shift(self) -> int:
+        """
+        Pick the chunk size for the next upload from the measured bandwidth
+        
+        The chunk size is negotiated once per upload in initialize_upload, so
+        measurements from one video size the chunks of the following ones.
+        
+        Returns:
+            Chunk size as a power of two (chunk_size == 1 << shift)
+        """
+        with self._bw_lock:
+            bw = self._ewma_bw
+        
+        if bw is None:
+            return CHUNK_SHIFT
+        shift = int(bw * self._target_rtt).bit_length() - 1
+        return max(MIN_CHUNK_SHIFT, min(MAX_CHUNK_SHIFT, shift))
+    
+    def initialize_upload(self, video_path: str, file_size: int,
+                          chunk_shift: int = CHUNK_SHIFT) -> Dict:
         """
         Initialize video upload to get upload URL
         
         Args:
             video_path: Path to video file
+            file_size: Size of the video file in bytes
+            chunk_shift: Chunk size as a power of two (chunk_size == 1 << shift)
             
         Returns:
             Upload initialization response with upload URL
         """
-        if not os.path.exists(video_path):
-            raise CustomException(f"Video file not found: {video_path}")
-        
-        # Get video file size
-        file_size = os.path.getsize(video_path)
+        chunk_size = 1 << chunk_shift
         
         # Initialize upload
         endpoint = "/post/publish/inbox/video/init/"
@@ -95,72 +404,151 @@ class TikTokScheduler:
             "source_info": {
                 "source": "FILE_UPLOAD",
                 "video_size": file_size,
-                "chunk_size": 10000000,  # 10MB chunks
-                "total_chunk_count": (file_size + 9999999) // 10000000
+                "chunk_size": chunk_size,
+                "total_chunk_count": (file_size + chunk_size - 1) >> chunk_shift
             }
         }
         
-        response = self._make_request("POST", endpoint, json=payload)
+        # Init only creates an upload session, so repeating it after a gateway
+        # error is harmless; publish is not retried this way
+        response = self._make_request("POST", endpoint, retry_server_errors=True, json=payload)
         return response
     
-    def upload_video_chunk(self, upload_url: str, video_path: str, 
-                          chunk_number: int, chunk_size: int = 10000000) -> bool:
+    def upload_video_chunk(self, upload_url: str, video_data: memoryview, 
+                          chunk_number: int, chunk_size: int = CHUNK_SIZE,
+                          content_sha256: Optional[str] = None) -> bool:
         """
         Upload a chunk of the video file
         
         Args:
             upload_url: Upload URL from initialization
-            video_path: Path to video file
+            video_data: Read-only view over the whole video file
             chunk_number: Current chunk number (0-indexed)
             chunk_size: Size of each chunk in bytes
+            content_sha256: Optional SHA-256 hex digest of the whole file, sent
+                with every chunk so retried chunks can be deduplicated
             
         Returns:
             True if upload successful
         """
-        try:
-            with open(video_path, 'rb') as f:
-                f.seek(chunk_number * chunk_size)
-                chunk_data = f.read(chunk_size)
-            
-            headers = {
-                "Content-Type": "video/mp4",
-                "Content-Range": f"bytes {chunk_number * chunk_size}-{chunk_number * chunk_size + len(chunk_data) - 1}/*"
-            }
-            
-            response = requests.put(upload_url, data=chunk_data, headers=headers)
-            response.raise_for_status()
-            return True
-        except Exception as e:
-            raise CustomException(f"Failed to upload chunk {chunk_number}: {str(e)}")
+        start = chunk_number * chunk_size
+        # Slicing the mapped file is zero-copy; release the view once sent so
+        # the mapping can be closed afterwards
+        with self._chunk_slots, video_data[start:start + chunk_size] as chunk_data:
+            # Only full chunks are bandwidth samples: a short tail chunk is
+            # dominated by round-trip time and would drag the estimate down
+            return self._put_chunk(upload_url, chunk_data, chunk_number, start, content_sha256,
+                                   record_throughput=len(chunk_data) == chunk_size)
     
-    def upload_video(self, video_path: str) -> str:
+    def _put_chunk(self, upload_url: str, chunk_data: memoryview,
+                   chunk_number: int, start: int,
+                   content_sha256: Optional[str] = None,
+                   record_throughput: bool = True) -> bool:
+        """PUT a single chunk, retrying server-side and transport errors"""
+        headers = {
+            "Content-Type": "video/mp4",
+            "Content-Range": f"bytes {start}-{start + len(chunk_data) - 1}/*"
+        }
+        if content_sha256:
+            headers["X-Content-SHA256"] = content_sha256
+        
+        for attempt in range(CHUNK_MAX_RETRIES + 1):
+            try:
+                started = time.perf_counter()
+                response = self.upload_session.put(upload_url, data=chunk_data, headers=headers,
+                                                   timeout=CHUNK_TIMEOUT)
+                response.raise_for_status()
+                if record_throughput:
+                    self._record_throughput(len(chunk_data), time.perf_counter() - started)
+                return True
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.HTTPError) as e:
+                # Only server-side and transport errors are worth retrying
+                retryable = not isinstance(e, requests.exceptions.HTTPError) or e.response.status_code >= 500
+                if not retryable or attempt == CHUNK_MAX_RETRIES:
+                    raise CustomException(f"Failed to upload chunk {chunk_number}: {str(e)}")
+                time.sleep(2 ** attempt)
+            except Exception as e:
+                raise CustomException(f"Failed to upload chunk {chunk_number}: {str(e)}")
+    
+    def upload_video(self, video_path: str, file_size: Optional[int] = None) -> str:
         """
         Upload complete video file to TikTok
         
         Args:
             video_path: Path to video file
+            file_size: Size of the video file in bytes, if already known
             
         Returns:
             Upload session ID
         """
-        print(f"Initializing upload for: {video_path}")
-        init_response = self.initialize_upload(video_path)
+        if file_size is None:
+            file_size = _stat_video(video_path)
         
-        upload_url = init_response.get("data", {}).get("upload_url")
-        upload_session_id = init_response.get("data", {}).get("upload_session_id")
-        
-        if not upload_url or not upload_session_id:
-            raise CustomException("Failed to get upload URL from initialization")
+        # Map the file once and hand out slices instead of re-opening and
+        # reading it for every chunk
+        fd = os.open(video_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            os.close(fd)
+            raise CustomException(f"Failed to read video file {video_path}: {str(e)}")
         
-        # Upload video in chunks
-        file_size = os.path.getsize(video_path)
-        chunk_size = 10000000  # 10MB
-        total_chunks = (file_size + chunk_size - 1) // chunk_size
+        # Pages already hashed or sent are dropped from this process right
+        # away, so resident memory stays around chunk_workers chunks instead of
+        # growing with the file size (the data remains in the page cache)
+        willneed = getattr(mmap, "MADV_WILLNEED", None)
+        dontneed = getattr(mmap, "MADV_DONTNEED", None)
         
-        print(f"Uploading {total_chunks} chunk(s)...")
-        for chunk_num in range(total_chunks):
-            self.upload_video_chunk(upload_url, video_path, chunk_num, chunk_size)
-            print(f"Uploaded chunk {chunk_num + 1}/{total_chunks}")
+        try:
+            # Hash the mapped file in a single call: hashlib hands the whole
+            # buffer to OpenSSL (SHA-NI where available) with the GIL released.
+            # This happens before initialize_upload so the upload session isn't
+            # left idle while a large file is read.
+            content_sha256 = hashlib.sha256(mm).hexdigest()
+            _advise(mm, dontneed, 0, file_size)
+            
+            print(f"Initializing upload for: {video_path}")
+            chunk_shift = self._next_chunk_shift()
+            chunk_size = 1 << chunk_shift
+            init_response = self.initialize_upload(video_path, file_size, chunk_shift)
+            
+            upload_url = init_response.get("data", {}).get("upload_url")
+            upload_session_id = init_response.get("data", {}).get("upload_session_id")
+            
+            if not upload_url or not upload_session_id:
+                raise CustomException("Failed to get upload URL from initialization")
+            
+            # Upload video in chunks
+            total_chunks = (file_size + chunk_size - 1) >> chunk_shift
+            
+            video_name = os.path.basename(video_path)
+            print(f"Uploading {total_chunks} chunk(s) for {video_name}...")
+            
+            # Ask the kernel to read ahead the first chunks while the first PUTs
+            # are being set up; each worker then prefetches the chunk it is likely
+            # to pick up next so disk reads overlap with network transfers
+            _advise(mm, willneed, 0, self.chunk_workers * chunk_size)
+            
+            with memoryview(mm) as video_data:
+                def _upload_chunk(chunk_num: int):
+                    _advise(mm, willneed, (chunk_num + self.chunk_workers) * chunk_size, chunk_size)
+                    self.upload_video_chunk(upload_url, video_data, chunk_num, chunk_size,
+                                            content_sha256)
+                    _advise(mm, dontneed, chunk_num * chunk_size, chunk_size)
+                    print(f"{video_name}: uploaded chunk {chunk_num + 1}/{total_chunks}")
+                
+                # Chunks carry their own Content-Range, so they can be sent
+                # concurrently. Only start as many workers as there are chunks;
+                # a single-chunk video is sent from this thread.
+                if total_chunks == 1:
+                    _upload_chunk(0)
+                else:
+                    with ThreadPoolExecutor(max_workers=min(self.chunk_workers, total_chunks)) as ex:
+                        list(ex.map(_upload_chunk, range(total_chunks)))
+        finally:
+            mm.close()
+            os.close(fd)
         
         return upload_session_id
     
@@ -181,33 +569,49 @@ class TikTokScheduler:
         """
         endpoint = "/post/publish/"
         
+        # Shallow copy so concurrent publishes never share a dict
+        post_info = dict(self._publish_post_info, title=caption, privacy_level=privacy_level)
+        
+        # Add scheduling if provided
+        if schedule_time:
+            # TikTok API expects Unix timestamp in seconds
+            post_info["schedule_time"] = int(schedule_time.timestamp())
+        
         payload = {
-            "post_info": {
-                "title": caption,
-                "privacy_level": privacy_level,
-                "disable_duet": False,
-                "disable_comment": False,
-                "disable_stitch": False,
-                "video_cover_timestamp_ms": 1000
-            },
+            "post_info": post_info,
             "source_info": {
                 "source": "FILE_UPLOAD",
                 "video_id": upload_session_id
             }
         }
         
-        # Add scheduling if provided
-        if schedule_time:
-            # TikTok API expects Unix timestamp in seconds
-            schedule_timestamp = int(schedule_time.timestamp())
-            payload["post_info"]["schedule_time"] = schedule_timestamp
-        
-        response = self._make_request("POST", endpoint, json=payload)
+        # Serialize ourselves (orjson when available) instead of letting
+        # requests run json.dumps; the session already sends the JSON header
+        response = self._make_request("POST", endpoint, data=_json_dumps(payload))
         return response
     
+    def upload_scheduled_video(self, video_path: str, schedule_time: datetime,
+                               file_size: Optional[int] = None) -> str:
+        """
+        Upload step of the scheduling workflow
+        
+        Args:
+            video_path: Path to video file
+            schedule_time: When the post will be scheduled
+            file_size: Size of the video file in bytes, if already known
+            
+        Returns:
+            Upload session ID
+        """
+        print(f"\nProcessing video: {os.path.basename(video_path)}")
+        print(f"Scheduled for: {schedule_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        return self.upload_video(video_path, file_size)
+    
     def schedule_video(self, video_path: str, caption: str, 
                       schedule_time: datetime,
-                      privacy_level: str = "PUBLIC_TO_EVERYONE") -> Dict:
+                      privacy_level: str = "PUBLIC_TO_EVERYONE",
+                      file_size: Optional[int] = None) -> Dict:
         """
         Complete workflow: upload and schedule a video
         
@@ -216,15 +620,13 @@ class TikTokScheduler:
             caption: Video caption
             schedule_time: When to schedule the post
             privacy_level: Privacy setting
+            file_size: Size of the video file in bytes, if already known
             
         Returns:
             Schedule response
         """
-        print(f"\nProcessing video: {os.path.basename(video_path)}")
-        print(f"Scheduled for: {schedule_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
         # Upload video
-        upload_session_id = self.upload_video(video_path)
+        upload_session_id = self.upload_scheduled_video(video_path, schedule_time, file_size)
         
         # Publish with schedule
         result = self.publish_video(upload_session_id, caption, privacy_level, schedule_time)
@@ -233,6 +635,41 @@ class TikTokScheduler:
         return result
 
 
+# Exact zero-padded layout accepted by the fromisoformat fast path; anything
+# else fromisoformat would accept (UTC offsets, ISO week dates, ...) must go
+# through strptime, which rejects it
+_SCHEDULE_TIME_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}(:\d{2})?', re.ASCII)
+
+
+def _parse_schedule_time(value: str) -> datetime:
+    """
+    Parse a 'YYYY-MM-DD HH:MM:SS' or 'YYYY-MM-DD HH:MM' schedule time
+    
+    Zero-padded values (the common case) take a single C-level
+    fromisoformat call; strptime is only consulted for the rest, e.g.
+    '2024-1-5 9:30'.
+    
+    Args:
+        value: Schedule time string
+        
+    Returns:
+        Parsed datetime
+        
+    Raises:
+        ValueError: If the value matches neither format
+    """
+    if _SCHEDULE_TIME_RE.fullmatch(value):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    
+    try:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M')
+
+
 def load_videos_from_csv(csv_path: str) -> List[Dict]:
     """
     Load video information from CSV file
@@ -251,13 +688,28 @@ def load_videos_from_csv(csv_path: str) -> List[Dict]:
     if not os.path.exists(csv_path):
         raise CustomException(f"CSV file not found: {csv_path}")
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        
+        # Resolve column positions once; a missing column points one past the
+        # header, which is always padded with '' below
+        width = len(header) + 1
+        path_i, caption_i, time_i, privacy_i = (
+            header.index(name) if name in header else len(header)
+            for name in ('video_path', 'caption', 'schedule_time', 'privacy_level')
+        )
+        
         for row in reader:
-            video_path = row.get('video_path', '').strip()
-            caption = row.get('caption', '').strip()
-            schedule_time_str = row.get('schedule_time', '').strip()
-            privacy_level = row.get('privacy_level', 'PUBLIC_TO_EVERYONE').strip()
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            
+            video_path = row[path_i].strip()
+            caption = row[caption_i].strip()
+            schedule_time_str = row[time_i].strip()
+            privacy_level = row[privacy_i].strip() or 'PUBLIC_TO_EVERYONE'
             
             if not video_path or not caption or not schedule_time_str:
                 print(f"Warning: Skipping incomplete row: {row}")
@@ -265,12 +717,9 @@ def load_videos_from_csv(csv_path: str) -> List[Dict]:
             
             # Parse schedule time
             try:
-                schedule_time = datetime.strptime(schedule_time_str, '%Y-%m-%d %H:%M:%S')
+                schedule_time = _parse_schedule_time(schedule_time_str)
             except ValueError:
-                try:
-                    schedule_time = datetime.strptime(schedule_time_str, '%Y-%m-%d %H:%M')
-                except ValueError:
-                    raise CustomException(f"Invalid schedule_time format: {schedule_time_str}. Use 'YYYY-MM-DD HH:MM:SS' or 'YYYY-MM-DD HH:MM'")
+                raise CustomException(f"Invalid schedule_time format: {schedule_time_str}. Use 'YYYY-MM-DD HH:MM:SS' or 'YYYY-MM-DD HH:MM'")
             
             videos.append({
                 'video_path': video_path,
@@ -305,19 +754,16 @@ def load_videos_from_json(json_path: str) -> List[Dict]:
     if not os.path.exists(json_path):
         raise CustomException(f"JSON file not found: {json_path}")
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(json_path, 'rb') as f:
+        data = _json_loads(f.read())
     
     videos = []
     for item in data:
         schedule_time_str = item.get('schedule_time', '')
         try:
-            schedule_time = datetime.strptime(schedule_time_str, '%Y-%m-%d %H:%M:%S')
+            schedule_time = _parse_schedule_time(schedule_time_str)
         except ValueError:
-            try:
-                schedule_time = datetime.strptime(schedule_time_str, '%Y-%m-%d %H:%M')
-            except ValueError:
-                raise CustomException(f"Invalid schedule_time format: {schedule_time_str}")
+            raise CustomException(f"Invalid schedule_time format: {schedule_time_str}")
         
         videos.append({
             'video_path': item['video_path'],
@@ -337,19 +783,25 @@ def main():
     if not os.path.exists(config_path):
         raise CustomException(f"Configuration file not found: {config_path}. Please create it using config.json.example")
     
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    with open(config_path, 'rb') as f:
+        config = _json_loads(f.read())
     
     client_key = config.get('client_key')
     client_secret = config.get('client_secret')
     access_token = config.get('access_token')
     input_file = config.get('input_file', 'videos.csv')
+    uploads_per_minute = _positive_setting(config, 'uploads_per_minute', UPLOADS_PER_MINUTE, integer=False)
+    max_workers = _positive_setting(config, 'max_workers', MAX_WORKERS)
+    chunk_workers = _positive_setting(config, 'chunk_workers', CHUNK_WORKERS)
+    publish_workers = _positive_setting(config, 'publish_workers', PUBLISH_WORKERS)
     
     if not all([client_key, client_secret, access_token]):
         raise CustomException("Missing required configuration: client_key, client_secret, or access_token")
     
     # Initialize scheduler
-    scheduler = TikTokScheduler(client_key, client_secret, access_token)
+    scheduler = TikTokScheduler(client_key, client_secret, access_token,
+                                max_workers=max_workers, chunk_workers=chunk_workers,
+                                publish_workers=publish_workers)
     
     # Load videos
     print(f"Loading videos from: {input_file}")
@@ -362,33 +814,83 @@ def main():
     
     print(f"Found {len(videos)} video(s) to schedule\n")
     
-    # Process each video
+    total = len(videos)
     successful = 0
     failed = 0
+    i = 0
     
-    for i, video_info in enumerate(videos, 1):
+    # Stat every file once up front so missing files are reported before any
+    # network work, and the size doesn't have to be looked up again later
+    ready = []
+    for video_info in videos:
         try:
-            print(f"\n[{i}/{len(videos)}] Processing video...")
-            scheduler.schedule_video(
-                video_path=video_info['video_path'],
-                caption=video_info['caption'],
-                schedule_time=video_info['schedule_time'],
-                privacy_level=video_info.get('privacy_level', 'PUBLIC_TO_EVERYONE')
-            )
-            successful += 1
-            
-            # Add delay between uploads to avoid rate limiting
-            if i < len(videos):
-                print("Waiting 5 seconds before next upload...")
-                time.sleep(5)
-                
+            video_info['_size'] = _stat_video(video_info['video_path'])
+            ready.append(video_info)
         except CustomException as e:
-            print(f"✗ Error: {str(e)}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ Unexpected error: {str(e)}")
+            i += 1
+            print(f"[{i}/{total}] ✗ {os.path.basename(video_info['video_path'])} - Error: {str(e)}")
             failed += 1
     
+    # Uploads and publishes run as two pipeline stages with separate pools:
+    # a finished upload is handed straight to the publish pool, so a slow
+    # publish never holds up an upload worker. Upload starts are paced with
+    # a token bucket.
+    bucket = TokenBucket(rate=uploads_per_minute / 60.0, capacity=max_workers)
+    
+    def _upload(video_info: Dict) -> str:
+        bucket.acquire()
+        return scheduler.upload_scheduled_video(
+            video_info['video_path'],
+            schedule_time=video_info['schedule_time'],
+            file_size=video_info['_size']
+        )
+    
+    def _publish(upload_session_id: str, video_info: Dict) -> Dict:
+        return scheduler.publish_video(
+            upload_session_id,
+            caption=video_info['caption'],
+            privacy_level=video_info.get('privacy_level', 'PUBLIC_TO_EVERYONE'),
+            schedule_time=video_info['schedule_time']
+        )
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as upload_pool, \
+            ThreadPoolExecutor(max_workers=publish_workers) as publish_pool:
+        pending = {upload_pool.submit(_upload, video_info): ('upload', video_info)
+                   for video_info in ready}
+        
+        # On Ctrl-C (or any other escape) drop everything still queued so only
+        # in-flight uploads finish; the executors' exit would otherwise wait
+        # for every remaining video to be uploaded
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    stage, video_info = pending.pop(fut)
+                    video_name = os.path.basename(video_info['video_path'])
+                    try:
+                        result = fut.result()
+                    except CustomException as e:
+                        i += 1
+                        print(f"\n[{i}/{total}] ✗ {video_name} - Error: {str(e)}")
+                        failed += 1
+                        continue
+                    except Exception as e:
+                        i += 1
+                        print(f"\n[{i}/{total}] ✗ {video_name} - Unexpected error: {str(e)}")
+                        failed += 1
+                        continue
+                    
+                    if stage == 'upload':
+                        pending[publish_pool.submit(_publish, result, video_info)] = ('publish', video_info)
+                    else:
+                        i += 1
+                        print(f"\n[{i}/{total}] ✓ {video_name}")
+                        successful += 1
+        except BaseException:
+            upload_pool.shutdown(wait=False, cancel_futures=True)
+            publish_pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    
     # Summary
     print(f"\n{'='*50}")
     print(f"Bulk scheduling complete!")